@@ -12,6 +12,20 @@ from .. import ast
 
 
 class Attribute(ABC):
+    # every client copies the whole lib_ast so there are thousands of these, most of
+    # them Method / Function leaves. slots keep those from each carrying a __dict__,
+    # Module and Class don't declare slots so they still get one for their children
+    __slots__ = (
+        "name",
+        "path_and_name",
+        "ref",
+        "attrs",
+        "return_type_name",
+        "is_property",
+        "client",
+        "return_pointer_type",
+    )
+
     client: Optional[Any]
 
     def __init__(
@@ -30,9 +44,15 @@ class Attribute(ABC):
         ] = {}  # any attrs of __add__ ... is none in this case
         self.return_type_name = return_type_name
         self.is_property = is_property
+        # set once here so the dispatch path can test it without a hasattr lookup
+        self.client = None
+        # resolved lazily by Callable.__call__ from the client's lib_ast
+        self.return_pointer_type: Optional[Any] = None
 
     def set_client(self, client: Any) -> None:
         self.client = client
+        # the cached pointer type came from the previous client's lib_ast
+        self.return_pointer_type = None
         for _, attr in self.attrs.items():
             if hasattr(attr, "set_client"):
                 attr.set_client(client=client)  # type: ignore
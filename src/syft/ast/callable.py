@@ -12,11 +12,14 @@ from .. import lib
 from ..core.node.common.action.function_or_constructor_action import (
     RunFunctionOrConstructorAction,
 )
+from ..core.node.common.action.run_class_method_action import property_type_names
 from .util import module_type
 from .util import unsplit
 
 
 class Callable(ast.attribute.Attribute):
+    __slots__ = ()
+
     client: Optional[Any]
 
     """A method, function, or constructor which can be directly executed"""
@@ -27,14 +30,15 @@ class Callable(ast.attribute.Attribute):
         return_callable: bool = False,
         **kwargs: Any,
     ) -> Optional[Union["Callable", CallableT]]:
-        if (
-            hasattr(self, "client")
-            and self.client is not None
-            and return_callable is False
-        ):
-            return_tensor_type_pointer_type = self.client.lib_ast(
-                path=self.return_type_name, return_callable=True
-            ).pointer_type
+        if self.client is not None and return_callable is False:
+            # the return type never changes for a given callable so we only need
+            # to walk the client's lib_ast for it on the first call
+            return_tensor_type_pointer_type = self.return_pointer_type
+            if return_tensor_type_pointer_type is None:
+                return_tensor_type_pointer_type = self.client.lib_ast(
+                    path=self.return_type_name, return_callable=True
+                ).pointer_type
+                self.return_pointer_type = return_tensor_type_pointer_type
 
             ptr = return_tensor_type_pointer_type(client=self.client)
 
@@ -85,7 +89,7 @@ class Callable(ast.attribute.Attribute):
                     raise Exception("Module cannot be attr of callable.")
                 else:
                     is_property = False
-                    if type(attr_ref).__name__ in ["getset_descriptor", "_tuplegetter"]:
+                    if type(attr_ref).__name__ in property_type_names:
                         is_property = True
 
                     self.attrs[path[index]] = ast.method.Method(
@@ -4,3 +4,5 @@ from .. import ast
 
 class Function(ast.callable.Callable):
     """"""
+
+    __slots__ = ()
@@ -1,7 +1,10 @@
 # stdlib
+from typing import Any
 from typing import Callable as CallableT
+from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
 # syft relative
@@ -17,6 +20,13 @@ class Globals(Module):
 
     def __init__(self) -> None:
         super().__init__("globals")
+        self.path_cache: Dict[Tuple[Any, int, bool], Any] = {}
+
+    def set_client(self, client: Any) -> None:
+        # lookups cached without a client return the raw ref, once there is a
+        # client those same lookups have to dispatch remotely instead
+        self.path_cache = {}
+        super().set_client(client=client)
 
     def __call__(
         self,
@@ -25,15 +35,33 @@ class Globals(Module):
         return_callable: bool = False,
         obj_type: Optional[type] = None,
     ) -> Optional[Union[Callable, CallableT]]:
+        # resolving a path walks the ast one segment at a time and the result never
+        # changes for a given path, so we remember it. obj_type lookups go through
+        # the Module lookup_cache instead and a client side walk without
+        # return_callable would execute remotely, so neither of those are cached
+        cacheable = obj_type is None and (return_callable or self.client is None)
+        if cacheable:
+            key = (
+                path if isinstance(path, str) else tuple(path),
+                index,
+                return_callable,
+            )
+            if key in self.path_cache:
+                return self.path_cache[key]
+
         if isinstance(path, str):
             path = path.split(".")
-        return self.attrs[path[index]](
+        resolved = self.attrs[path[index]](
             path=path,
             index=index + 1,
             return_callable=return_callable,
             obj_type=obj_type,
         )
 
+        if cacheable:
+            self.path_cache[key] = resolved
+        return resolved
+
     def add_path(
         self,
         path: Union[str, List[str]],
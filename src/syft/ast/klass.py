@@ -22,6 +22,41 @@ from ..core.pointer.pointer import Pointer
 from ..util import aggressive_set_attr
 
 
+class LazyPointerMethod:
+    """Builds a pointer method the first time it is looked up
+
+    Every client gets its own copy of each pointer class, so rather than building
+    thousands of run_class_methods up front the pointer class holds one of these
+    per method. On first lookup (from an instance or the class) it builds the real
+    method and replaces itself on the class, so later lookups never come back here.
+    Unlike a __getattr__ fallback this keeps the methods visible to dir() / help()
+    and on the class itself.
+    """
+
+    __slots__ = ("build", "attr_path_and_name", "return_type_name", "name", "owner")
+
+    def __init__(
+        self,
+        build: CallableT[[str, str], CallableT],
+        attr_path_and_name: str,
+        return_type_name: str,
+    ) -> None:
+        self.build = build
+        self.attr_path_and_name = attr_path_and_name
+        self.return_type_name = return_type_name
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        self.owner = owner
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        method = self.build(self.attr_path_and_name, self.return_type_name)
+        setattr(self.owner, self.name, method)
+        if instance is None:
+            return method
+        return method.__get__(instance, owner)
+
+
 class Class(Callable):
     def __init__(
         self,
@@ -44,7 +79,8 @@ class Class(Callable):
     def create_pointer_class(self) -> None:
         def get_run_class_method(
             attr_path_and_name: str,
-        ) -> object:  # TODO: tighten to return Callable
+            return_type_name: str,
+        ) -> CallableT:
             """It might seem hugely un-necessary to have these methods nested in this way.
             However, it has to do with ensuring that the scope of attr_path_and_name is local
             and not global. If we do not put a get_run_class_method around run_class_method then
@@ -54,38 +90,40 @@ class Class(Callable):
             variable and when we call get_run_class_method multiple times it returns genuinely
             different methods each time with a different internal attr_path_and_name variable."""
 
+            # the return type of attr_path_and_name is fixed when the ast is built
+            # so we split its path once here instead of on every call
+            return_type_path = return_type_name.split(".")
+            # resolve the module attribute chain once instead of on every call
+            downcast_args_and_kwargs = lib.python.util.downcast_args_and_kwargs
+
             def run_class_method(
                 __self: Any,
                 *args: Tuple[Any, ...],
                 **kwargs: Any,
             ) -> object:
-                # we want to get the return type which matches the attr_path_and_name
-                # so we ask lib_ast for the return type name that matches out
-                # attr_path_and_name and then use that to get the actual pointer klass
-                # then set the result to that pointer klass
-                return_type_name = __self.client.lib_ast(
-                    attr_path_and_name, return_callable=True
-                ).return_type_name
-                resolved_pointer_type = __self.client.lib_ast(
-                    return_type_name, return_callable=True
+                # every attribute read on a pointer goes through its __getattribute__
+                # override so we only read the client off __self once per call
+                client = __self.client
+
+                # we use the return type path to get the actual pointer klass from
+                # this client's lib_ast and then set the result to that pointer klass
+                resolved_pointer_type = client.lib_ast(
+                    return_type_path, return_callable=True
                 )
-                result = resolved_pointer_type.pointer_type(client=__self.client)
+                result = resolved_pointer_type.pointer_type(client=client)
 
                 # QUESTION can the id_at_location be None?
                 result_id_at_location = getattr(result, "id_at_location", None)
                 if result_id_at_location is not None:
 
                     # first downcast anything primitive which is not already PyPrimitive
-                    (
-                        downcast_args,
-                        downcast_kwargs,
-                    ) = lib.python.util.downcast_args_and_kwargs(
+                    downcast_args, downcast_kwargs = downcast_args_and_kwargs(
                         args=args, kwargs=kwargs
                     )
 
                     # then we convert anything which isnt a pointer into a pointer
                     pointer_args, pointer_kwargs = pointerize_args_and_kwargs(
-                        args=downcast_args, kwargs=downcast_kwargs, client=__self.client
+                        args=downcast_args, kwargs=downcast_kwargs, client=client
                     )
 
                     cmd = RunClassMethodAction(
@@ -94,18 +132,25 @@ class Class(Callable):
                         args=pointer_args,
                         kwargs=pointer_kwargs,
                         id_at_location=result_id_at_location,
-                        address=__self.client.address,
+                        address=client.address,
                     )
-                    __self.client.send_immediate_msg_without_reply(msg=cmd)
+                    client.send_immediate_msg_without_reply(msg=cmd)
 
                 return result
 
+            # name the method after the attr it dispatches so tracebacks and reprs
+            # don't show every pointer method as run_class_method
+            method_name = attr_path_and_name.split(".")[-1]
+            run_class_method.__name__ = method_name
+            run_class_method.__qualname__ = f"{self.pointer_name}.{method_name}"
+
             return run_class_method
 
-        attrs = {}
+        attrs: Dict[str, Any] = {}
         _props: List[str] = []
         for attr_name, attr in self.attrs.items():
             attr_path_and_name = getattr(attr, "path_and_name", None)
+            attr_return_type_name = getattr(attr, "return_type_name", None)
 
             # if the Method.is_property == True
             # we need to add this attribute name into the _props list
@@ -118,8 +163,23 @@ class Class(Callable):
             # where Callable is ast.callable.Callable
             # where CallableT is typing.Callable == any function, method, lambda
             # so we have to check for path_and_name
-            if attr_path_and_name is not None:
-                attrs[attr_name] = get_run_class_method(attr_path_and_name)
+            if attr_path_and_name is not None and attr_return_type_name is not None:
+                # special methods are looked up straight off the type by the
+                # interpreter so those are always built up front
+                if attr_name.startswith("__"):
+                    attrs[attr_name] = get_run_class_method(
+                        attr_path_and_name, attr_return_type_name
+                    )
+                else:
+                    attrs[attr_name] = LazyPointerMethod(
+                        get_run_class_method,
+                        attr_path_and_name,
+                        attr_return_type_name,
+                    )
+
+        # every attribute access on a Pointer goes through getattribute below so we
+        # close over a frozenset of the props rather than looking up _props each time
+        props = frozenset(_props)
 
         def getattribute(__self: Any, name: str) -> Any:
             # we need to override the __getattribute__ of our Pointer class
@@ -127,9 +187,8 @@ class Class(Callable):
             # get the wrapped run_class_method but also execute it immediately
             # object.__getattribute__ is the way we prevent infinite recursion
             attr = object.__getattribute__(__self, name)
-            props = object.__getattribute__(__self, "_props")
 
-            # if the attr key name is in the _props list from above then we know
+            # if the attr key name is in the props set from above then we know
             # we should execute it immediately and return the result
             if name in props:
                 return attr()
@@ -170,8 +229,8 @@ class Class(Callable):
             ptr = getattr(outer_self, outer_self.pointer_name)(
                 client=client,
                 id_at_location=id_at_location,
-                tags=self.tags if hasattr(self, "tags") else list(),
-                description=self.description if hasattr(self, "description") else "",
+                tags=getattr(self, "tags", list()),
+                description=getattr(self, "description", ""),
             )
 
             if searchable:
@@ -243,12 +302,10 @@ class Class(Callable):
 
 
 def ispointer(obj: Any) -> bool:
-    if (
-        type(obj).__name__.endswith("Pointer")
-        and type(getattr(obj, "id_at_location", None)) is UID
-    ):
-        return True
-    return False
+    # every pointer class is created by create_pointer_class as a subclass of
+    # Pointer so a single isinstance check in C replaces matching the class name
+    # and reading id_at_location through the pointer's __getattribute__ override
+    return isinstance(obj, Pointer)
 
 
 def convert_param_to_remote_pointer(param: Any, client: Any) -> Pointer:
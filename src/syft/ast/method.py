@@ -4,3 +4,5 @@ from .. import ast
 
 class Method(ast.callable.Callable):
     """"""
+
+    __slots__ = ()
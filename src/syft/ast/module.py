@@ -91,17 +91,7 @@ class Module(ast.attribute.Attribute):
                     attr_name=path[index],
                     attr=klass,
                 )
-            elif isinstance(attr_ref, func_type):
-                self.add_attr(
-                    attr_name=path[index],
-                    attr=ast.function.Function(
-                        path[index],
-                        unsplit(path[: index + 1]),
-                        attr_ref,
-                        return_type_name=return_type_name,
-                    ),
-                )
-            elif isinstance(attr_ref, builtin_func_type):
+            elif isinstance(attr_ref, (func_type, builtin_func_type)):
                 self.add_attr(
                     attr_name=path[index],
                     attr=ast.function.Function(
@@ -111,9 +101,12 @@ class Module(ast.attribute.Attribute):
                         return_type_name=return_type_name,
                     ),
                 )
+        else:
+            # every allowlist entry walks through its parent modules, so we only
+            # resolve the segment on ref once per call on either branch
+            attr_ref = getattr(self.ref, path[index], None)
 
         attr = self.attrs[path[index]]
-        attr_ref = getattr(self.ref, path[index], None)
         if attr_ref is not None and attr_ref not in self.lookup_cache:
             self.lookup_cache[attr_ref] = path
         if hasattr(attr, "add_path"):
@@ -32,7 +32,6 @@ class UID(Serializable):
 
     value: uuid_type
 
-    @syft_decorator(typechecking=True)
     def __init__(self, value: Optional[uuid_type] = None):
         """Initializes the internal id using the uuid package.
 
@@ -63,6 +62,13 @@ class UID(Serializable):
             # https://docs.python.org/3/library/uuid.html
             value = uuid.uuid4()
 
+        # a UID is created for nearly every object in syft, so instead of the
+        # typechecking decorator we check the one argument directly
+        elif not isinstance(value, uuid_type):
+            raise TypeError(
+                f"UID value must be a {uuid_type.__name__}, got {type(value).__name__}"
+            )
+
         # save the ID's value. Note that this saves the uuid value
         # itself instead of saving the
         self.value = value
@@ -24,6 +24,10 @@ from ....store.storeable_object import StorableObject
 from ...abstract.node import AbstractNode
 from .common import ImmediateActionWithoutReply
 
+# type names of class attributes which are read through __get__ rather than called,
+# a frozenset so the per-attribute checks are a hash lookup instead of a list scan
+property_type_names = frozenset({"getset_descriptor", "_tuplegetter"})
+
 
 class RunClassMethodAction(ImmediateActionWithoutReply):
     """
@@ -117,7 +121,7 @@ class RunClassMethodAction(ImmediateActionWithoutReply):
             )
             resolved_kwargs[arg_name] = r_arg.data
 
-        if type(method).__name__ in ["getset_descriptor", "_tuplegetter"]:
+        if type(method).__name__ in property_type_names:
             # we have a detached class property so we need the __get__ descriptor
             upcast_attr = getattr(resolved_self.data, "upcast", None)
             data = resolved_self.data
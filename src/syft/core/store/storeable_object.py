@@ -286,9 +286,10 @@ class StorableObject(AbstractStorableObject):
 
 class VerifyKeyWrapper(StorableObject):
     def __init__(self, value: VerifyKey):
+        _id = getattr(value, "id", None)
         super().__init__(
             data=value,
-            id=getattr(value, "id", UID()),
+            id=_id if _id is not None else UID(),
             tags=getattr(value, "tags", []),
             description=getattr(value, "description", ""),
         )
@@ -329,9 +330,10 @@ aggressive_set_attr(
 
 class VerifyAllWrapper(StorableObject):
     def __init__(self, value: object):
+        _id = getattr(value, "id", None)
         super().__init__(
             data=value,
-            id=getattr(value, "id", UID()),
+            id=_id if _id is not None else UID(),
             tags=getattr(value, "tags", []),
             description=getattr(value, "description", ""),
         )
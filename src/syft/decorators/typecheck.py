@@ -104,10 +104,13 @@ def type_hints(
                 f"function {decorated.__qualname__}."
             )
 
+    # wrap once here rather than building a new typechecked wrapper on every call
+    typechecked_decorated = typechecked(decorated)
+
     def decorator(*args: Tuple[Any, ...], **kwargs: Any) -> type:
         if prohibit_args:
             check_args(*args, **kwargs)
-        return typechecked(decorated)(*args, **kwargs)
+        return typechecked_decorated(*args, **kwargs)
 
     decorator.__annotations__ = decorated.__annotations__
     decorator.__qualname__ = decorated.__qualname__
@@ -115,9 +118,8 @@ def type_hints(
     decorator.__doc__ = decorated.__doc__
     decorator.__module__ = decorated.__module__
 
-    old_signature = inspect.signature(decorated)
-
+    # reuse the signature computed above instead of inspecting decorated again
     # https://github.com/python/mypy/issues/5958
-    decorator.__signature__ = old_signature  # type: ignore
+    decorator.__signature__ = literal_signature  # type: ignore
 
     return decorator
@@ -166,9 +166,10 @@ class Complex(complex, PyPrimitive):
 
 class ComplexWrapper(StorableObject):
     def __init__(self, value: object):
+        _id = getattr(value, "id", None)
         super().__init__(
             data=value,
-            id=getattr(value, "id", UID()),
+            id=_id if _id is not None else UID(),
             tags=getattr(value, "tags", []),
             description=getattr(value, "description", ""),
         )
@@ -281,9 +281,10 @@ class Dict(UserDict, PyPrimitive):
 
 class DictWrapper(StorableObject):
     def __init__(self, value: object):
+        _id = getattr(value, "id", None)
         super().__init__(
             data=value,
-            id=getattr(value, "id", UID()),
+            id=_id if _id is not None else UID(),
             tags=getattr(value, "tags", []),
             description=getattr(value, "description", ""),
         )
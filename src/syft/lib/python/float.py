@@ -273,9 +273,10 @@ class Float(float, PyPrimitive):
 
 class FloatWrapper(StorableObject):
     def __init__(self, value: object):
+        _id = getattr(value, "id", None)
         super().__init__(
             data=value,
-            id=getattr(value, "id", UID()),
+            id=_id if _id is not None else UID(),
             tags=getattr(value, "tags", []),
             description=getattr(value, "description", ""),
         )
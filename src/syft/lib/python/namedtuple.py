@@ -54,7 +54,9 @@ ValuesIndices = namedtuple("ValuesIndices", all_attrs)  # type: ignore
 
 class ValuesIndicesWrapper(StorableObject):
     def __init__(self, value: object):
-        _id = getattr(value, "id", UID())
+        _id = getattr(value, "id", None)
+        if _id is None:
+            _id = UID()
         obj_type, values = ValuesIndicesWrapper.get_parts(return_tuple=value)
         return_tuple = ValuesIndicesWrapper.make_namedtuple(
             obj_type=obj_type, values=values, id=_id
@@ -31,6 +31,10 @@ primitives = [
     UserString,
 ]
 
+# isprimitive runs on every arg sent to and every result stored from a remote call
+# so it checks against a hashed set rather than scanning the list above
+primitive_types = frozenset(primitives)
+
 PrimitiveType = Union[
     bool,
     dict,
@@ -48,11 +52,9 @@ PrimitiveType = Union[
 ]
 
 
-@syft_decorator(typechecking=True)
 def isprimitive(value: Any) -> bool:
-    if not issubclass(type(value), PyPrimitive) and type(value) in primitives:
-        return True
-    return False
+    # exact type match, subclasses such as the PyPrimitives are not primitives
+    return type(value) in primitive_types
 
 
 class PrimitiveFactory(ABC):
@@ -1,5 +1,8 @@
 # stdlib
+from functools import lru_cache
 from typing import Dict
+from typing import List
+from typing import Tuple
 from typing import Union
 
 # third party
@@ -38,8 +41,11 @@ def version_supported(support_dict: Union[str, Dict[str, str]]) -> bool:
         return True
 
 
-def create_torch_ast() -> Globals:
-    ast = Globals()
+# the supported allowlist only depends on the installed torch version, so we
+# filter it once and reuse it every time a client copies the lib_ast
+@lru_cache(maxsize=None)
+def get_supported_allowlist() -> Tuple[Tuple[str, str], ...]:
+    supported: List[Tuple[str, str]] = []
 
     # most methods work in all versions and have a single return type
     # for the more complicated ones we pass a dict with keys like return_type and
@@ -50,21 +56,28 @@ def create_torch_ast() -> Globals:
             if return_type == "unknown":
                 # this allows us to import them for testing
                 continue
-            ast.add_path(
-                path=method, framework_reference=torch, return_type_name=return_type
-            )
+            supported.append((method, return_type))
             # add all the torch.nn.Parameter hooks
             if method.startswith("torch.Tensor."):
                 method = method.replace("torch.Tensor.", "torch.nn.Parameter.")
                 return_type = return_type.replace("torch.Tensor", "torch.nn.Parameter")
-                ast.add_path(
-                    path=method, framework_reference=torch, return_type_name=return_type
-                )
+                supported.append((method, return_type))
         else:
             pass
             # TODO: Replace with logging
             # print(f"Skipping {method} not supported in {TORCH_VERSION}")
 
+    return tuple(supported)
+
+
+def create_torch_ast() -> Globals:
+    ast = Globals()
+
+    for method, return_type in get_supported_allowlist():
+        ast.add_path(
+            path=method, framework_reference=torch, return_type_name=return_type
+        )
+
     for klass in ast.classes:
         klass.create_pointer_class()
         klass.create_send_method()
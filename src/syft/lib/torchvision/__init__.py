@@ -1,5 +1,8 @@
 # stdlib
+from functools import lru_cache
 from typing import Dict
+from typing import List
+from typing import Tuple
 from typing import Union
 
 # third party
@@ -27,8 +30,11 @@ def version_supported(support_dict: Union[str, Dict[str, str]]) -> bool:
         return TORCHVISION_VERSION >= version.parse(support_dict["min_version"])
 
 
-def create_torchvision_ast() -> Globals:
-    ast = Globals()
+# the supported allowlist only depends on the installed torchvision version,
+# so we filter it once and reuse it every time a client copies the lib_ast
+@lru_cache(maxsize=None)
+def get_supported_allowlist() -> Tuple[Tuple[str, str], ...]:
+    supported: List[Tuple[str, str]] = []
 
     # most methods work in all versions and have a single return type
     # for the more complicated ones we pass a dict with keys like return_type and
@@ -36,16 +42,25 @@ def create_torchvision_ast() -> Globals:
     for method, return_type_name_or_dict in allowlist.items():
         if version_supported(support_dict=return_type_name_or_dict):
             return_type = get_return_type(support_dict=return_type_name_or_dict)
-            ast.add_path(
-                path=method,
-                framework_reference=tv,
-                return_type_name=return_type,
-            )
+            supported.append((method, return_type))
         else:
             print(
                 f"Skipping torchvision.{method} not supported in {TORCHVISION_VERSION}"
             )
 
+    return tuple(supported)
+
+
+def create_torchvision_ast() -> Globals:
+    ast = Globals()
+
+    for method, return_type in get_supported_allowlist():
+        ast.add_path(
+            path=method,
+            framework_reference=tv,
+            return_type_name=return_type,
+        )
+
     for klass in ast.classes:
         klass.create_pointer_class()
         klass.create_send_method()
@@ -0,0 +1,52 @@
+# stdlib
+from typing import Any
+from typing import Optional
+
+# syft absolute
+import syft as sy
+from syft.ast.callable import Callable
+from syft.ast.klass import Class
+
+
+def cached_pointer_type(callable: Callable) -> Optional[Any]:
+    # read through a call so mypy doesn't carry an `is None` narrowing of the
+    # attribute across the remote calls below
+    return callable.return_pointer_type
+
+
+def test_callable_caches_return_pointer_type() -> None:
+    alice_client = sy.VirtualMachine(name="alice").get_client()
+    bob_client = sy.VirtualMachine(name="bob").get_client()
+
+    tensor = alice_client.lib_ast("torch.Tensor", return_callable=True)
+    assert isinstance(tensor, Callable)
+    assert cached_pointer_type(tensor) is None
+
+    ptr = alice_client.torch.Tensor([1, 2])
+    assert cached_pointer_type(tensor) is type(ptr)
+    assert ptr.get().tolist() == [1, 2]
+
+    # moving the callable to another client drops the cached type and the next
+    # call resolves it again from the new client's lib_ast
+    tensor.set_client(bob_client)
+    assert cached_pointer_type(tensor) is None
+
+    bob_ptr: Any = tensor((3, 4))
+    bob_tensor = bob_client.lib_ast("torch.Tensor", return_callable=True)
+    assert isinstance(bob_tensor, Class)
+    assert cached_pointer_type(tensor) is bob_tensor.pointer_type
+    assert cached_pointer_type(tensor) is not type(ptr)
+    assert bob_ptr.client is bob_client
+    assert bob_ptr.get().tolist() == [3, 4]
+
+
+def test_callable_leaves_have_no_instance_dict() -> None:
+    lib_ast = sy.lib_ast.copy()
+    assert lib_ast is not None
+
+    method = lib_ast("torch.Tensor.add", return_callable=True)
+    assert not hasattr(method, "__dict__")
+
+    # classes still need one for their pointer types
+    klass = lib_ast("torch.Tensor", return_callable=True)
+    assert hasattr(klass, "__dict__")
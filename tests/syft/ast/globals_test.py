@@ -0,0 +1,36 @@
+# third party
+import torch
+
+# syft absolute
+import syft as sy
+from syft.ast.callable import Callable
+
+
+def test_globals_caches_resolved_paths() -> None:
+    lib_ast = sy.lib_ast.copy()
+    assert lib_ast is not None
+
+    add = lib_ast("torch.Tensor.add", return_callable=True)
+    assert isinstance(add, Callable)
+    assert ("torch.Tensor.add", 0, True) in lib_ast.path_cache
+    assert lib_ast(["torch", "Tensor", "add"], return_callable=True) is add
+    assert lib_ast("torch.Tensor.add") is add.ref
+
+
+def test_globals_skips_cache_for_obj_type_lookups() -> None:
+    lib_ast = sy.lib_ast.copy()
+    assert lib_ast is not None
+
+    lib_ast("torch.Tensor", return_callable=True, obj_type=torch.Tensor)
+    assert lib_ast.path_cache == {}
+
+
+def test_globals_set_client_clears_cache() -> None:
+    lib_ast = sy.lib_ast.copy()
+    assert lib_ast is not None
+
+    lib_ast("torch.Tensor.add")
+    assert lib_ast.path_cache != {}
+
+    lib_ast.set_client(sy.VirtualMachine().get_client())
+    assert lib_ast.path_cache == {}
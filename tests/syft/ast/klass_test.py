@@ -0,0 +1,63 @@
+# stdlib
+from typing import Any
+from typing import Optional
+
+# third party
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.ast.globals import Globals
+from syft.ast.klass import Class
+from syft.ast.klass import LazyPointerMethod
+
+
+def get_tensor_pointer_type(lib_ast: Optional[Globals]) -> Any:
+    # pointer classes are built at runtime so there's nothing static to type them as
+    assert lib_ast is not None
+    klass = lib_ast("torch.Tensor", return_callable=True)
+    assert isinstance(klass, Class)
+    return klass.pointer_type
+
+
+def test_pointer_methods_are_built_on_first_access() -> None:
+    tensor_pointer_type = get_tensor_pointer_type(sy.lib_ast.copy())
+
+    # special methods have to live on the class up front
+    assert callable(tensor_pointer_type.__dict__["__add__"])
+    assert isinstance(tensor_pointer_type.__dict__["add"], LazyPointerMethod)
+
+    ptr = tensor_pointer_type(client=None)
+    ptr.gc_enabled = False
+    assert "add" in dir(ptr)
+    assert ptr.add.__func__ is tensor_pointer_type.__dict__["add"]
+    assert tensor_pointer_type.add.__name__ == "add"
+
+    # class level access builds it too
+    assert tensor_pointer_type.sum is tensor_pointer_type.__dict__["sum"]
+
+
+def test_pointer_property_errors_are_not_retried() -> None:
+    tensor_pointer_type = get_tensor_pointer_type(sy.lib_ast.copy())
+
+    calls = []
+
+    class BrokenClient:
+        def lib_ast(self, *args: Any, **kwargs: Any) -> None:
+            calls.append(args)
+            raise AttributeError("boom")
+
+    ptr = tensor_pointer_type(client=BrokenClient())
+    ptr.gc_enabled = False
+    for expected in (1, 2):
+        with pytest.raises(AttributeError, match="boom"):
+            ptr.is_leaf
+        assert len(calls) == expected
+
+
+def test_pointer_method_named_after_attr() -> None:
+    tensor_pointer_type = get_tensor_pointer_type(sy.lib_ast)
+
+    method = tensor_pointer_type.__dict__["__add__"]
+    assert method.__name__ == "__add__"
+    assert method.__qualname__ == "TensorPointer.__add__"
@@ -0,0 +1,10 @@
+# syft absolute
+from syft.lib.torch import get_supported_allowlist
+
+
+def test_supported_allowlist_is_cached() -> None:
+    supported = get_supported_allowlist()
+
+    assert get_supported_allowlist() is supported
+    assert ("torch.Tensor.add", "torch.Tensor") in supported
+    assert ("torch.nn.Parameter.add", "torch.nn.Parameter") in supported